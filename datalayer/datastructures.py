@@ -1,21 +1,20 @@
-from types import SimpleNamespace
 from typing import (
     Any,
     NamedTuple,
     Tuple,
 )
 
-OPERATORS = SimpleNamespace(**{op: op for op in (
-    'eq',
-    'gt',
-    'gte',
-    'lt',
-    'lte',
-    'ne',
-)})
+EQ = 'eq'
+GT = 'gt'
+GTE = 'gte'
+LT = 'lt'
+LTE = 'lte'
+NE = 'ne'
+
+OPERATORS = frozenset((EQ, GT, GTE, LT, LTE, NE))
 
 
 class Query(NamedTuple):
-    keys: Tuple[str]
+    keys: Tuple[str, ...]
     operator: str
     value: Any
@@ -2,10 +2,14 @@ from datalayer.utils import typename
 
 
 class Error(Exception):
-    """Base library error class."""
+    """Base library error class.
 
-    def __init__(self, *parts):
-        super().__init__(self.join(*parts))
+    The message parts are kept in `args` and only joined when the error
+    is formatted, so `args` doesn't hold the full message.
+    """
+
+    def __str__(self):
+        return self.join(*self.args)
 
     @staticmethod
     def join(*parts):
@@ -14,31 +18,38 @@ class Error(Exception):
 
 class SpecError(Error):
 
-    def __init__(self, spec, *parts):
+    def __init__(self, spec, *parts, expected=None, actual=None):
         self.spec = spec
+        self.expected = expected
+        self.actual = actual
         super().__init__(*parts)
 
+    def __str__(self):
+        parts = self.args
+        if self.expected:
+            msg = f'expected {self.expected}'
+            if self.actual:
+                msg = f'{msg}, got {self.actual}'
+            parts = (*parts, msg)
+        return self.join(*parts)
+
     @classmethod
     def wrong_type(cls, spec, *parts, expected=None, actual=None):
-        if expected:
-            msg = f'expected {expected}'
-            if actual:
-                msg = f'{msg}, got {actual}'
-            parts = [*parts, msg]
-        return cls(spec, 'wrong type', *parts)
+        return cls(spec, 'wrong type', *parts,
+                   expected=expected, actual=actual)
 
 
 class SchemaError(SpecError):
     """Error raised when a Spec schema is invalid."""
 
-    def __init__(self, spec, *parts):
-        self.spec = spec
-        super().__init__('invalid schema', typename(spec), *parts)
+    def __str__(self):
+        return self.join('invalid schema', typename(self.spec),
+                         super().__str__())
 
 
 class ValidationError(SpecError):
     """Error raised when a value fails Spec validation."""
 
-    def __init__(self, spec, *parts):
-        self.spec = spec
-        super().__init__(f'invalid value for {typename(spec)}', *parts)
+    def __str__(self):
+        return self.join(f'invalid value for {typename(self.spec)}',
+                         super().__str__())
@@ -1,19 +1,53 @@
-from typing import Mapping, List
+from typing import Callable, Mapping, List
 
 from datalayer import config
-from datalayer.datastructures import Query
-from datalayer.exceptions import SchemaError
+from datalayer.datastructures import EQ, Query
 from datalayer.specs import CompoundSpec
 
+_SEP = config.QUERYSTRING_SEP
+
 
 def parse_url_params(spec: CompoundSpec, url_params: Mapping[str, str]) -> List[Query]:
     queries = []
+    paths = spec.paths()
     for key, val in url_params.items():
-        parts = key.split(config.QUERYSTRING_SEP)
-        for part in parts:
-            try:
-                sub_spec = spec.get(part)
-            except SchemaError:
-                break
-        queries.append(Query(parts, 'eq', sub_spec))
+        # Most keys are a single segment or miss on their first one, so
+        # only split keys whose first segment is actually in the schema
+        head, sep, _ = key.partition(_SEP)
+        if not sep:
+            parts = (head,)
+        elif (head,) in paths:
+            parts = tuple(key.split(_SEP))
+        else:
+            continue
+        sub_spec = paths.get(parts)
+        if sub_spec is not None:
+            queries.append(Query(parts, EQ, sub_spec))
     return queries
+
+
+def compile_parser(spec: CompoundSpec) -> Callable[[Mapping[str, str]], List[Query]]:
+    """Return a parse_url_params equivalent bound to the given spec.
+
+    Each key path is joined with the separator up front, so parsing a key
+    is a single dict lookup with no splitting. Build one parser per spec
+    and reuse it across requests.
+    """
+    # parse_url_params splits keys on the separator, so leave out paths
+    # that don't split back into themselves, e.g. segments containing it
+    lookup = {
+        key: (path, sub_spec)
+        for path, sub_spec in spec.paths().items()
+        for key in (_SEP.join(path),)
+        if tuple(key.split(_SEP)) == path
+    }.get
+
+    def parse(url_params: Mapping[str, str]) -> List[Query]:
+        queries = []
+        for key in url_params:
+            found = lookup(key)
+            if found is not None:
+                queries.append(Query(found[0], EQ, found[1]))
+        return queries
+
+    return parse
@@ -1,7 +1,9 @@
-import abc
+import linecache
+import weakref
 from collections import namedtuple
 from collections.abc import Container, Mapping, MutableMapping, Sequence
-from typing import Any
+from itertools import repeat
+from typing import Any, Mapping as MappingType, Tuple
 
 from datalayer.exceptions import SchemaError, ValidationError
 from datalayer.utils import SubclassDict, typename
@@ -11,18 +13,37 @@ class _DEFAULT:
     """Generic default value for when None doesn't cut it."""
 
 
-class Spec(abc.ABC):
+class Spec:
+    __slots__ = ('spec', '_innermost')
+
+    # Python data type this Spec represents. Set on the class, or on the
+    # instance (with a slot) when it depends on the spec.
+    base_type: type
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, 'base_type'):
+            raise TypeError(f'{typename(cls)} must define base_type')
 
     def __init__(self, spec: Any):
+        if type(self) is Spec:
+            raise TypeError(f'{typename(Spec)} is abstract; use a subclass')
         self.spec = self.validate_spec(spec)
 
+        # Specs don't change after construction, and inner Specs are built
+        # first, so reuse their already-unwrapped result
+        inner = self.inner()
+        if isinstance(inner, Spec):
+            inner = inner.innermost()
+        self._innermost = inner
+
     def __eq__(self, other):
         return self.spec == other.spec
 
-    @property
-    @abc.abstractmethod
-    def base_type(self):
-        """Python data type this Spec represents."""
+    def __reduce__(self):
+        # Copy and pickle by rebuilding from the schema, since Specs may hold
+        # generated validators, and Atoms must go back through interning
+        return type(self), (self.spec,)
 
     def validate_spec(self, spec: Any) -> Any:
         """Validate the spec, raising a SchemaError if invalid."""
@@ -30,38 +51,66 @@ class Spec(abc.ABC):
 
     def validate(self, value: Any) -> Any:
         """Validate the given value, raising a ValidationError if invalid."""
-        if not isinstance(value, self.base_type):
+        base_type = self.base_type
+        # Exact-type match is a pointer compare; fall back to isinstance
+        # for subclasses and ABCs
+        if type(value) is not base_type and not isinstance(value, base_type):
             raise ValidationError.wrong_type(
                 self,
-                expected=f"'{typename(self.base_type)}'",
+                expected=f"'{typename(base_type)}'",
                 actual=f"'{typename(value)}'")
         return value
 
+    def _validator(self):
+        """Return the callable that validate() dispatches to."""
+        return self.validate
+
+    def paths(self) -> MappingType[Tuple[str, ...], 'Spec']:
+        """Return a flat mapping of key paths to the Specs found under them."""
+        return {}
+
     def inner(self) -> Any:
         """Return the inner object wrapped by this Spec."""
         return self.spec
 
     def innermost(self) -> Any:
         """Unwrap inner Specs, returning the first non-Spec."""
-        inner = self.inner()
-        while isinstance(inner, Spec):
-            inner = inner.inner()
-        return inner
+        return self._innermost
 
 
 class Atom(Spec):
+    __slots__ = ('base_type', '__weakref__')
 
-    @property
-    def base_type(self):
-        return self.spec
+    # Atoms are immutable and wrap a single type, so each type gets one
+    # shared instance for as long as anything refers to it
+    _interned = weakref.WeakValueDictionary()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # __init__ would re-run on the shared instance on every construction
+        if '__init__' in cls.__dict__:
+            raise TypeError(
+                f'{typename(cls)} must not define __init__; Atoms are '
+                'initialized once, in __new__')
+
+    def __new__(cls, spec: Any):
+        try:
+            return cls._interned[cls, spec]
+        except (KeyError, TypeError):
+            pass
+        self = super().__new__(cls)
+        super(Atom, self).__init__(spec)
+        self.base_type = self.spec
+        cls._interned[cls, spec] = self
+        return self
+
+    def __init__(self, spec: Any):
+        # Initialized in __new__, so interned instances are left untouched
+        pass
 
     def validate_spec(self, spec: Any) -> Any:
-        is_type = issubclass(type(spec), type)
-        if is_type:
-            is_spec = issubclass(spec, Spec)
-        else:
-            is_spec = isinstance(spec, Spec)
-        if is_spec:
+        is_type = isinstance(spec, type)
+        if issubclass(spec, Spec) if is_type else isinstance(spec, Spec):
             raise SchemaError(self, 'cannot be a Spec')
         if not is_type:
             raise SchemaError.wrong_type(
@@ -72,6 +121,7 @@ class Atom(Spec):
 
 
 class CompoundSpec(Spec):
+    __slots__ = ()
     base_type = Container
 
     def _validate_spec_or_type(self, value):
@@ -87,8 +137,25 @@ class CompoundSpec(Spec):
 
 
 class Model(CompoundSpec):
+    __slots__ = (
+        '_paths', '_fields', '_expected_len', '_validate', '__weakref__')
     base_type = Mapping
 
+    def __init__(self, spec: Any):
+        super().__init__(spec)
+
+        # Flatten nested paths once, so lookups by full path are O(1)
+        paths = {}
+        for key, val in self.spec.items():
+            paths[(key,)] = val
+            for path, sub_spec in val.paths().items():
+                paths[(key, *path)] = sub_spec
+        self._paths = paths
+
+        self._fields = tuple(self.spec.items())
+        self._expected_len = len(self.spec)
+        self._validate = self._compile_validate()
+
     def validate_spec(self, spec: Any) -> Mapping:
         if isinstance(spec, type):
             raise SchemaError.wrong_type(
@@ -108,6 +175,67 @@ class Model(CompoundSpec):
         return validated_spec
 
     def validate(self, value: object) -> Mapping:
+        return self._validate(value)
+
+    def _validator(self):
+        # Subclasses that override validate must not be bypassed
+        if type(self).validate is Model.validate:
+            return self._validate
+        return self.validate
+
+    def _compile_validate(self):
+        """Generate a validate function with the field checks unrolled.
+
+        Atom fields are checked inline, and other fields call straight into
+        their Spec's validator. Failures, and inputs that aren't a
+        plain dict, are handed off to the regular methods.
+        """
+        # Only hold a proxy to self, so the Model and its generated function
+        # don't form a reference cycle and are freed by refcounting
+        namespace = {
+            '_self': weakref.proxy(self),
+            '_DEFAULT': _DEFAULT,
+        }
+        lines = [
+            'def validate(value):',
+            '    if type(value) is not dict:',
+            '        value = _self._coerce(value)',
+            f'    if len(value) != {self._expected_len}:',
+            '        _self._wrong_len(value)',
+        ]
+        for i, (field, field_spec) in enumerate(self._fields):
+            key = repr(field)
+            lines += [
+                f'    item = value.get({key}, _DEFAULT)',
+                '    if item is _DEFAULT:',
+                f'        _self._missing({key})',
+            ]
+            if type(field_spec) is Atom:
+                namespace[f'_t{i}'] = field_spec.base_type
+                namespace[f'_v{i}'] = field_spec.validate
+                lines += [
+                    f'    if type(item) is not _t{i} and not isinstance(item, _t{i}):',
+                    f'        _v{i}(item)',
+                ]
+            else:
+                namespace[f'_v{i}'] = field_spec._validator()
+                lines.append(f'    value[{key}] = _v{i}(item)')
+        lines.append('    return value')
+
+        # Register the source with linecache, so tracebacks and debuggers
+        # can show the generated code, for as long as this Model lives
+        source = '\n'.join(lines) + '\n'
+        filename = f'<{typename(self)}-{id(self):x} validate>'
+        linecache.cache[filename] = (
+            len(source), None, source.splitlines(True), filename)
+        weakref.finalize(self, linecache.cache.pop, filename, None)
+
+        # Pop the function out of its own globals, which would be a cycle too
+        exec(compile(source, filename, 'exec'), namespace)
+        return namespace.pop('validate')
+
+    def _coerce(self, value: object) -> MutableMapping:
+        """Convert a value that isn't a dict to a MutableMapping."""
         try:
             value = super().validate(value)
         except ValidationError:
@@ -121,24 +249,21 @@ class Model(CompoundSpec):
 
         if not isinstance(value, MutableMapping):
             value = dict(value)
+        return value
 
-        if len(value) > len(self.spec):
-            raise ValidationError(
-                self,
-                'too many items'
-                f'expected {len(self.spec)}, got {len(value)}')
-        if len(value) < len(self.spec):
-            raise ValidationError(
-                self,
-                'too few items',
-                f'expected {len(self.spec)}, got {len(value)}')
+    def _wrong_len(self, value: Mapping):
+        actual_len = len(value)
+        raise ValidationError(
+            self,
+            'too many items' if actual_len > self._expected_len
+            else 'too few items',
+            f'expected {self._expected_len}, got {actual_len}')
 
-        for field, field_spec in self.spec.items():
-            if field not in value:
-                raise ValidationError(self, f"field '{field}' not found")
-            value[field] = field_spec.validate(value[field])
+    def _missing(self, field: str):
+        raise ValidationError(self, f"field '{field}' not found")
 
-        return value
+    def paths(self) -> MappingType[Tuple[str, ...], Spec]:
+        return self._paths
 
     def inner(self, item=_DEFAULT, default=_DEFAULT):
         if item is _DEFAULT:
@@ -153,8 +278,10 @@ class Model(CompoundSpec):
 
 
 class Map(CompoundSpec):
+    __slots__ = ()
     base_type = Mapping
     Spec = namedtuple('MapSpec', ('key', 'value'))
+    Spec.__qualname__ = 'Map.Spec'
 
     def validate_spec(self, spec: Any) -> Spec:
         if not (isinstance(spec, Sequence) and len(spec) == 2):
@@ -175,17 +302,37 @@ class Map(CompoundSpec):
 
 
 class Seq(CompoundSpec):
+    __slots__ = ('_validate_item', '_item_type')
     base_type = Sequence
 
+    def __init__(self, spec: Any):
+        super().__init__(spec)
+        self._validate_item = self.spec._validator()
+        self._item_type = (
+            self.spec.base_type if type(self.spec) is Atom else None)
+
     def validate_spec(self, spec: Any) -> Spec:
         spec = self._validate_spec_or_type(spec)
         return spec
 
     def validate(self, value: Sequence) -> Sequence:
-        value = super().validate(value)
         cls = type(value)
-        value = cls(self.spec.validate(item) for item in value)
-        return value
+        # Skip the Sequence ABC check for the common concrete types
+        if cls is not list and cls is not tuple:
+            value = super().validate(value)
+        validate_item = self._validate_item
+
+        # Atoms return items unchanged, so just type check them all in C,
+        # and only go item by item to report the one that failed
+        item_type = self._item_type
+        if item_type is not None:
+            if not all(map(isinstance, value, repeat(item_type))):
+                for item in value:
+                    validate_item(item)
+            return cls(value)
+
+        items = [validate_item(item) for item in value]
+        return items if cls is list else cls(items)
 
 
 """A mapping of Python types to their corresponding Spec classes."""
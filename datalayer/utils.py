@@ -1,23 +1,29 @@
-from collections import OrderedDict
 from collections.abc import MutableMapping
 
 
+_MISSING = object()
+
+
 def typename(x):
     """Return the class name of a type or object."""
-    try:
-        return x.__name__
-    except AttributeError:
-        return type(x).__name__
+    return x.__name__ if isinstance(x, type) else type(x).__name__
 
 
 class SubclassDict(MutableMapping):
     """Dict that uses a subclass check for lookups.
 
-    Keys must all be 'type' objects.
+    Keys must all be 'type' objects. When several keys match, the one
+    nearest in the looked-up type's MRO wins. Resolved lookups are cached per
+    type until the dict is next modified.
     """
 
+    __slots__ = ('data', '_cache')
+
+    CACHE_SIZE = 1024
+
     def __init__(self, *args, **kwargs):
-        self.data = OrderedDict()
+        self.data = {}
+        self._cache = {}
         self.update(*args, **kwargs)
 
     @staticmethod
@@ -25,49 +31,80 @@ class SubclassDict(MutableMapping):
         if not isinstance(key, type):
             raise TypeError(f"not a type: {repr(key)}")
 
-    def __str__(self):
-        return f'{typename(self)}({str(self.data)})'
-
     def __repr__(self):
-        return f'{typename(self)}({repr(self.data)})'
+        return f'{typename(self)}({self.data!r})'
+
+    __str__ = __repr__
+
+    def __eq__(self, other):
+        # Compare the underlying dicts directly rather than through lookups
+        if isinstance(other, SubclassDict):
+            return self.data == other.data
+        return super().__eq__(other)
 
     def __getitem__(self, item):
-        self.__validate_key(item)
-
-        # Find all keys that are subclasses of `item`
-        matches = []
-        for key in self.data:
-            if issubclass(item, key):
-                matches.append(key)
-
-        # If only one match, return it
-        if len(matches) == 1:
-            return self.data[matches[0]]
-
-        # If more than one match, find the nearest subclass in the MRO
-        if len(matches) > 1:
-            min_idx = None
-            best_match = None
-            mro = item.__mro__[:-1]
-            for match in matches:
-                try:
-                    idx = mro.index(match)
-                except ValueError:
-                    continue
-                if min_idx is None or idx < min_idx:
-                    min_idx = idx
-                    best_match = match
-            return self.data[best_match]
-
-        # If no matches, raise a KeyError
-        raise KeyError(item)
+        try:
+            value = self._cache[item]
+        except (KeyError, TypeError):
+            value = self.__lookup(item)
+        if value is _MISSING:
+            raise KeyError(item)
+        return value
+
+    def __contains__(self, item):
+        return self.get(item, _MISSING) is not _MISSING
+
+    def get(self, item, default=None):
+        try:
+            value = self._cache[item]
+        except (KeyError, TypeError):
+            value = self.__lookup(item)
+        return default if value is _MISSING else value
+
+    def __lookup(self, item):
+        """Resolve and cache a lookup, returning _MISSING if not found."""
+        if not isinstance(item, type):
+            raise TypeError(f"not a type: {repr(item)}")
+        value = self.__resolve(item)
+        # Keep the cache bounded, e.g. for lookups on generated classes
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[item] = value
+        return value
+
+    def __resolve(self, item: type):
+        # The most specific key wins. Walk the MRO first, so real base
+        # classes are found with plain dict lookups.
+        data = self.data
+        for base in item.__mro__[:-1]:
+            value = data.get(base, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        # Then fall back to subclass checks for virtual bases (e.g. ABCs),
+        # in insertion order, and finally `object`. Any other key in the
+        # MRO would already have matched above.
+        for key, value in data.items():
+            if key is not object and issubclass(item, key):
+                return value
+        return data.get(object, _MISSING)
 
     def __setitem__(self, key: type, value):
         self.__validate_key(key)
         self.data[key] = value
+        self._cache.clear()
+
+    def update(self, *args, **kwargs):
+        # Check all the keys up front, then insert them in a single call
+        items = dict(*args, **kwargs)
+        for key in items:
+            self.__validate_key(key)
+        self.data.update(items)
+        self._cache.clear()
 
     def __delitem__(self, key: type):
         del self.data[key]
+        self._cache.clear()
 
     def __iter__(self):
         return iter(self.data)
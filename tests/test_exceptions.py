@@ -0,0 +1,34 @@
+from datalayer import specs
+from datalayer.exceptions import Error, SchemaError, ValidationError
+
+
+def test_error():
+    assert str(Error('foo', '', None, 'bar')) == 'foo: bar'
+    assert str(Error()) == ''
+
+
+def test_spec_error():
+    spec = specs.Atom(int)
+
+    err = ValidationError(spec, 'too few items')
+    assert err.spec is spec
+    assert str(err) == 'invalid value for Atom: too few items'
+
+    err = SchemaError(spec, 'cannot be a Spec')
+    assert err.spec is spec
+    assert str(err) == 'invalid schema: Atom: cannot be a Spec'
+
+    # Should only mention what was given
+    err = ValidationError.wrong_type(spec, expected="'int'", actual="'str'")
+    assert str(err) == (
+        "invalid value for Atom: wrong type: expected 'int', got 'str'")
+    err = ValidationError.wrong_type(spec, expected="'int'")
+    assert str(err) == "invalid value for Atom: wrong type: expected 'int'"
+    err = ValidationError.wrong_type(spec, actual="'str'")
+    assert str(err) == 'invalid value for Atom: wrong type'
+
+    # Should keep the unformatted parts in args
+    err = SchemaError.wrong_type(spec, 'bad', expected="'type'")
+    assert err.args == ('wrong type', 'bad')
+    assert err.expected == "'type'"
+    assert repr(err) == "SchemaError('wrong type', 'bad')"
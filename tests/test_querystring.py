@@ -0,0 +1,75 @@
+from datalayer import config, specs
+from datalayer.datastructures import EQ, Query
+from datalayer.sources import querystring
+
+
+def key(*parts):
+    return config.QUERYSTRING_SEP.join(parts)
+
+
+def test_parse_url_params():
+    spec = specs.Model({
+        'name': str,
+        'pet': specs.Model({'name': str, 'age': int}),
+    })
+
+    # Should resolve top-level and nested keys
+    queries = querystring.parse_url_params(spec, {
+        'name': 'bob',
+        key('pet', 'age'): '3',
+    })
+    assert queries == [
+        Query(('name',), EQ, specs.Atom(str)),
+        Query(('pet', 'age'), EQ, specs.Atom(int)),
+    ]
+
+    # Should skip keys that leave the schema
+    assert querystring.parse_url_params(spec, {
+        'greeting': 'hello',
+        key('pet', 'color'): 'red',
+        key('name', 'first'): 'bob',
+        key('pet', ''): 'x',
+    }) == []
+
+
+def test_compile_parser():
+    spec = specs.Model({
+        'name': str,
+        'pet': specs.Model({'name': str, 'age': int}),
+    })
+    parse = querystring.compile_parser(spec)
+
+    # Should match parse_url_params
+    url_params = {
+        'name': 'bob',
+        key('pet', 'age'): '3',
+        'greeting': 'hello',
+        key('pet', 'color'): 'red',
+    }
+    assert parse(url_params) == querystring.parse_url_params(spec, url_params)
+    assert parse({}) == []
+
+    # Should match parse_url_params when field names contain the separator
+    spec = specs.Model({
+        key('a', 'b'): int,
+        'a': specs.Model({'b': str, 'c': int}),
+    })
+    parse = querystring.compile_parser(spec)
+    url_params = {key('a', 'b'): '1', key('a', 'c'): '2'}
+    assert parse(url_params) == querystring.parse_url_params(spec, url_params)
+    assert parse(url_params) == [
+        Query(('a', 'b'), EQ, specs.Atom(str)),
+        Query(('a', 'c'), EQ, specs.Atom(int)),
+    ]
+
+    # Should match parse_url_params when a field name ends with part of
+    # the separator, e.g. 'type_' with '__', which splits differently
+    tail = config.QUERYSTRING_SEP[-1]
+    spec = specs.Model({
+        'type' + tail: specs.Model({'x': int}),
+        'name': str,
+    })
+    parse = querystring.compile_parser(spec)
+    url_params = {key('type' + tail, 'x'): '1', 'name': 'bob'}
+    assert parse(url_params) == querystring.parse_url_params(spec, url_params)
+    assert parse(url_params) == [Query(('name',), EQ, specs.Atom(str))]
@@ -1,4 +1,8 @@
-from types import SimpleNamespace
+import copy
+import linecache
+import pickle
+from collections.abc import Mapping
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 
@@ -13,6 +17,16 @@ def custom_spec():
     return MySpec
 
 
+def test_base_type_required():
+    with pytest.raises(TypeError):
+        class MySpec(specs.Spec):
+            pass
+
+    # Should not allow instantiating the base class itself
+    with pytest.raises(TypeError):
+        specs.Spec(5)
+
+
 class TestAtom:
 
     def test_validate_spec(self, custom_spec):
@@ -36,6 +50,32 @@ class TestAtom:
         assert specs.Atom(int).spec is int
         assert specs.Atom(list).spec is list
 
+    def test_interned(self):
+        # Should share one instance per type
+        assert specs.Atom(int) is specs.Atom(int)
+        assert specs.Atom(int) is not specs.Atom(float)
+        assert specs.Model({'x': int}).spec['x'] is specs.Atom(int)
+
+        # Should not share instances across subclasses
+        class MyAtom(specs.Atom):
+            pass
+        assert MyAtom(int) is MyAtom(int)
+        assert type(MyAtom(int)) is MyAtom
+        assert specs.Atom(int) is not MyAtom(int)
+
+        # Should reject subclasses that would re-initialize shared instances
+        with pytest.raises(TypeError):
+            class BadAtom(specs.Atom):
+                def __init__(self, spec):
+                    pass
+
+        # Should copy and pickle to the interned instance
+        atom = specs.Atom(int)
+        assert copy.copy(atom) is atom
+        assert copy.deepcopy(atom) is atom
+        assert pickle.loads(pickle.dumps(atom)) is atom
+        assert copy.deepcopy(specs.Seq(int)).spec is atom
+
     def test_validate(self):
         spec = specs.Atom(int)
 
@@ -50,6 +90,12 @@ class TestAtom:
         # Should pass on correct type
         assert spec.validate(5) == 5
 
+        # Should pass on subclasses of the type, same as isinstance
+        assert spec.validate(True) is True
+        spec = specs.Atom(Mapping)
+        value = {'x': 1}
+        assert spec.validate(value) is value
+
 
 def spec_fields(fields=None):
     fields = fields or {}
@@ -119,6 +165,83 @@ class TestModel:
         spec_value_obj = SimpleNamespace(**spec_value)
         assert spec.validate(spec_value_obj) == spec_value_obj.__dict__
 
+        # Should accept non-dict mappings
+        assert spec.validate(MappingProxyType(spec_value)) == spec_value
+
+        # Should validate nested Specs
+        spec = specs.Model(spec_fields({
+            'kids': specs.Seq(specs.Model({'name': str})),
+            'pet': specs.Model({'name': str}),
+        }))
+        spec_value = {**spec_value, 'kids': [{'name': 'sue'}],
+                      'pet': {'name': 'rex'}}
+        assert spec.validate(dict(spec_value)) == spec_value
+        with pytest.raises(ValidationError):
+            spec.validate({**spec_value, 'pet': {'name': 5}})
+        with pytest.raises(ValidationError):
+            spec.validate({**spec_value, 'kids': [{'name': 5}]})
+
+        # Should not bypass subclasses that override validate
+        class Strict(specs.Model):
+            def validate(self, value):
+                value = super().validate(value)
+                if value['n'] < 0:
+                    raise ValidationError(self, 'negative')
+                return value
+        strict = Strict({'n': int})
+        with pytest.raises(ValidationError):
+            specs.Model({'x': strict}).validate({'x': {'n': -1}})
+        with pytest.raises(ValidationError):
+            specs.Seq(strict).validate([{'n': -1}])
+        assert specs.Seq(strict).validate([{'n': 1}]) == [{'n': 1}]
+
+        # Should validate against the schema a subclass's hook returns
+        class WithId(specs.Model):
+            def validate_spec(self, spec):
+                spec = super().validate_spec(spec)
+                spec['id'] = specs.Atom(int)
+                return spec
+        spec = WithId({'name': str})
+        assert spec.validate({'name': 'x', 'id': 1}) == {'name': 'x', 'id': 1}
+        with pytest.raises(ValidationError):
+            spec.validate({'name': 'x'})
+        assert ('id',) in spec.paths()
+
+        # Should allow field names that aren't identifiers
+        spec = specs.Model({"it's": int, 'a\nb': str})
+        assert spec.validate({"it's": 1, 'a\nb': 'x'}) == {"it's": 1, 'a\nb': 'x'}
+        with pytest.raises(ValidationError):
+            spec.validate({"it's": 1, 'a\nb': 2})
+
+    def test_copy(self):
+        spec = specs.Model(spec_fields({
+            'kids': specs.Seq(specs.Model({'name': str})),
+            'attributes': specs.Map((str, int)),
+        }))
+        value = {'name': 'bob', 'age': 13, 'height': 33.3, 'verified': True,
+                 'kids': [{'name': 'sue'}], 'attributes': {'x': 1}}
+
+        # Should rebuild from the schema when copied or pickled
+        for spec_copy in (copy.copy(spec), copy.deepcopy(spec),
+                          pickle.loads(pickle.dumps(spec))):
+            assert type(spec_copy) is specs.Model
+            assert spec_copy == spec
+            assert spec_copy.validate(dict(value)) == value
+
+    def test_generated_source(self):
+        spec = specs.Model(spec_fields({
+            'kids': specs.Seq(specs.Model({'name': str})),
+        }))
+        kid_spec = spec.inner('kids').inner()
+        filenames = [model._validator().__code__.co_filename
+                     for model in (spec, kid_spec)]
+        assert all(filename in linecache.cache for filename in filenames)
+
+        # Should drop the source once the Models are gone, without needing
+        # the cycle collector
+        del spec, kid_spec
+        assert not any(filename in linecache.cache for filename in filenames)
+
     def test_inner(self):
         spec = specs.Model(spec_fields())
 
@@ -159,6 +282,21 @@ class TestModel:
         assert spec.inner('matrices').innermost() is int
         assert spec.inner('name').innermost() is str
 
+    def test_paths(self):
+        kids = specs.Model({'name': str})
+        spec = specs.Model({'name': str, 'kids': kids})
+
+        # Should map every key path to the Spec found under it
+        assert spec.paths() == {
+            ('name',): specs.Atom(str),
+            ('kids',): kids,
+            ('kids', 'name'): specs.Atom(str),
+        }
+
+        # Should have no paths for non-Model Specs
+        assert specs.Atom(str).paths() == {}
+        assert specs.Seq(kids).paths() == {}
+
 
 class TestMap:
 
@@ -239,6 +377,8 @@ class TestSeq:
         # Happy path
         value = [1, 2, 3]
         assert spec.validate(value) == value
+        assert spec.validate((1, 2, 3)) == (1, 2, 3)
+        assert spec.validate([]) == []
 
         # Should work with nested CompoundSpec
         spec = specs.Seq(specs.Model({'name': str, 'age': int}))
@@ -248,6 +388,14 @@ class TestSeq:
         ]
         assert spec.validate(value) == value
 
+        # Should validate against the schema a subclass's hook returns
+        class Wrapped(specs.Seq):
+            def validate_spec(self, spec):
+                return specs.Atom(int)
+        with pytest.raises(ValidationError):
+            Wrapped(str).validate(['x'])
+        assert Wrapped(str).validate([1]) == [1]
+
 
 def test_from_python():
     assert type(specs.from_python({'foo': str})) is specs.Model
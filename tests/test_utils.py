@@ -1,3 +1,5 @@
+from collections.abc import Mapping, Sequence
+
 import pytest
 
 from datalayer import utils
@@ -43,20 +45,61 @@ def test_subclassdict(parent, child1, grandchild1):
     assert d[int] == 'x'
     assert d.get(int) == 'x'
     assert d.get(list) is None
+    assert d.get(list, 'z') == 'z'
+    assert int in d
+    assert list not in d
     d[parent] = 3
     assert d[parent] == 3
     assert d[child1] == 3
     assert d[grandchild1] == 3
     d[child1] = 5
     assert d[grandchild1] == 5
+    del d[child1]
+    assert d[grandchild1] == 3
 
     with pytest.raises(KeyError):
         _ = d[dict]
+    with pytest.raises(KeyError):
+        _ = d[dict]
+    assert dict not in d
+
     with pytest.raises(TypeError):
         d.update({1: 2})
     with pytest.raises(TypeError):
         d.update(foo='bar')
 
+    # Should update all keys or none
+    with pytest.raises(TypeError):
+        d.update({list: 'l', 'tuple': 't'})
+    assert list not in d
+    d.update({list: 'l'})
+    assert d[list] == 'l'
+
+    # Should prefer real bases over virtual ones, and `object` last
+    d = utils.SubclassDict({object: 'o', Mapping: 'm', Sequence: 's'})
+    assert d[dict] == 'm'
+    assert d[list] == 's'
+    assert d[int] == 'o'
+    d[dict] = 'd'
+    assert d[dict] == 'd'
+    assert d[type('MyDict', (dict,), {})] == 'd'
+
+    # Should stay correct when the lookup cache overflows
+    class SmallSubclassDict(utils.SubclassDict):
+        CACHE_SIZE = 2
+    d = SmallSubclassDict({parent: 1})
+    kids = [type(f'Kid{i}', (parent,), {}) for i in range(5)]
+    assert [d[kid] for kid in kids] == [1] * 5
+    assert len(d._cache) <= 2
+
+    # Should compare equal by contents
+    d = utils.SubclassDict({int: 'x', str: 'y'})
+    assert d == utils.SubclassDict({str: 'y', int: 'x'})
+    assert d == d.copy()
+    assert d == {int: 'x', str: 'y'}
+    assert d != utils.SubclassDict({int: 'x'})
+    assert d != [int, str]
+
     with pytest.raises(TypeError):
         utils.SubclassDict({'x': 5})
     with pytest.raises(TypeError):